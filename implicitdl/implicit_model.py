@@ -1,23 +1,44 @@
 import torch
 from torch import nn
-import torch.nn.functional as F
 from typing import Optional
 from .implicit_function import ImplicitFunction, ImplicitFunctionInf
-from .utils import transpose
 import math
 
+# torch.compiler.disable exists from torch 2.1; fall back to a no-op decorator
+# on older builds so the models still import
+try:
+    _dynamo_disable = torch.compiler.disable
+except AttributeError:
+    def _dynamo_disable(fn):
+        return fn
+
 class ImplicitModel(nn.Module):
     def __init__(self, n: int, p: int, q: int,
                  f: Optional[ImplicitFunction] = ImplicitFunctionInf,
                  no_D: Optional[bool] = False,
-                 bias: Optional[bool] = False):
+                 bias: Optional[bool] = False,
+                 dtype: torch.dtype = torch.float32,
+                 compile: Optional[bool] = False,
+                 use_fused_kernel: Optional[bool] = False,
+                 a_kind: str = 'dense',
+                 k: Optional[int] = None,
+                 diag: Optional[bool] = False):
         """
         Create a new Implicit Model:
-            A: n*n  B: n*p  C: q*n  D: q*p
-            X: n*m  U: p*m, m = batch size
-            Note that for X and U, the batch size comes first when inputting into the model.
-            These sizes reflect that the model internally transposes them so that their sizes line up with ABCD.
-        
+            A: n*n  B: p*n  C: n*q  D: p*q
+            X: m*n  U: m*p, m = batch size
+            All weights act on the right (X = phi(X A + U B), Y = X C + U D), so inputs
+            and hidden states stay in their natural batch-first layout and no transposes
+            are needed anywhere in the forward pass.
+
+        The parameterization of A is selected by a_kind; everything else (input
+        handling, the fixed-point solve, the output projection) is shared:
+            'dense':     A is a full n*n matrix.
+            'lora':      A = L R with rank-k factors (L: n*k, R stored pre-transposed
+                         as k*n), each projected onto the norm ball.
+            'lora_diag': A = Diag + L R, with the diagonal and the factors projected
+                         so their sum stays inside the norm ball.
+
         Args:
             n: the number of hidden features.
             p: the number of input features.
@@ -25,198 +46,323 @@ class ImplicitModel(nn.Module):
             f: the implicit function to use.
             no_D: whether or not to use the D matrix (i. e. whether the prediction equation should explicitly depend on the input U).
             bias: whether or not to use a bias.
+            dtype: dtype of the weights; fp16/bf16 hit the Tensor Core GEMM paths
+                (run under torch.autocast so the activations follow).
+            compile: wrap forward in torch.compile(mode="reduce-overhead") to remove
+                per-op dispatch overhead; the fixed-point solver itself stays eager.
+            use_fused_kernel: run each Picard step through the fused Triton
+                matmul+ReLU kernel (CUDA only; ignored when triton is missing).
+            a_kind: how A is parameterized: 'dense', 'lora' or 'lora_diag'.
+            k: the LoRA dimension of A (required for 'lora' and 'lora_diag').
+            diag: for 'lora_diag', whether Diag is a full diagonal vector rather
+                than a single shared scalar.
         """
         super(ImplicitModel, self).__init__()
 
-        if bias:
-            p += 1
+        if a_kind not in ('dense', 'lora', 'lora_diag'):
+            raise ValueError(f"Unknown a_kind '{a_kind}', expected 'dense', 'lora' or 'lora_diag'.")
+        if a_kind != 'dense' and k is None:
+            raise ValueError(f"a_kind='{a_kind}' requires the LoRA dimension k.")
 
         self.n = n
         self.p = p
         self.q = q
+        self.a_kind = a_kind
 
-        self.A = nn.Parameter(torch.randn(n, n)/n)
-        self.B = nn.Parameter(torch.randn(n, p)/n)
-        self.C = nn.Parameter(torch.randn(q, n)/n)
-        self.D = nn.Parameter(torch.randn(q, p)/n) if not no_D else torch.zeros((q, p), requires_grad=False)
-
-        self.f = f
-        self.bias = bias
-
-    def forward(self, U: torch.Tensor, X0: Optional[torch.Tensor] = None):
-        if (len(U.size()) == 3):
-            U = U.flatten(1, -1)
-        U = transpose(U)
-        if self.bias:
-            U = F.pad(U, (0, 0, 0, 1), value=1)
-        assert U.shape[0] == self.p, f'Given input size {U.shape[0]} does not match expected input size {self.p}.'
-
-        m = U.shape[1]
-        X_shape = torch.Size([self.n, m])
-
-        if X0 is not None:
-            X0 = transpose(X0)
-            assert X0.shape == X_shape
+        if a_kind == 'dense':
+            self.A = nn.Parameter(torch.empty(n, n, dtype=dtype).normal_(0.0, 1.0/n))
         else:
-            X0 = torch.zeros(X_shape, dtype=U.dtype, device=U.device)
-
-        X = self.f.apply(self.A, self.B, X0, U)
-        return transpose(self.C @ X + self.D @ U)
-
-class ImplicitModelLoRA(nn.Module):
-    def __init__(self, k: int, n: int, p: int, q: int,
-                 f: Optional[ImplicitFunction] = ImplicitFunctionInf,
-                 no_D: Optional[bool] = False,
-                 bias: Optional[bool] = False):
-        """
-        Create a new Implicit Model:
-            A1: n*r  A2: r*n  B: n*p  C: q*n  D: q*p
-            X: n*m  U: p*m, m = batch size
-            Note that for X and U, the batch size comes first when inputting into the model.
-            These sizes reflect that the model internally transposes them so that their sizes line up with ABCD.
-        
-        Args:
-            r: the LoRA dimension of A
-            n: the number of hidden features.
-            p: the number of input features.
-            q: the number of output classes.
-            f: the implicit function to use.
-            no_D: whether or not to use the D matrix (i. e. whether the prediction equation should explicitly depend on the input U).
-            bias: whether or not to use a bias.
-        """
-        super(ImplicitModelLoRA, self).__init__()
-
-        if bias:
-            p += 1
-
-        self.k = k
-        self.n = n
-        self.p = p
-        self.q = q
-
-        self.L = nn.Parameter(torch.randn(n, k)/n)
-        self.R = nn.Parameter(torch.randn(n, k)/n)
-        self.B = nn.Parameter(torch.randn(n, p)/n)
-        self.C = nn.Parameter(torch.randn(q, n)/n)
-        self.D = nn.Parameter(torch.randn(q, p)/n) if not no_D else torch.zeros((q, p), requires_grad=False)
-
+            self.k = k
+            self.L = nn.Parameter(torch.empty(n, k, dtype=dtype).normal_(0.0, 1.0/n))
+            # R is stored pre-transposed as (k, n): the GEMM gets a natively
+            # contiguous operand and no per-forward transpose view or copy
+            self.R = nn.Parameter(torch.empty(k, n, dtype=dtype).normal_(0.0, 1.0/n))
+            if a_kind == 'lora_diag':
+                self.diag = diag
+                if self.diag:
+                    self.Diag = nn.Parameter(torch.empty(n, dtype=dtype).normal_(0.0, 1.0/n))
+                else:
+                    self.Diag = nn.Parameter(torch.empty(1, 1, dtype=dtype).normal_(0.0, 1.0/n))
+
+        self.B = nn.Parameter(torch.empty(p, n, dtype=dtype).normal_(0.0, 1.0/n))
+        self.C = nn.Parameter(torch.empty(n, q, dtype=dtype).normal_(0.0, 1.0/n))
+        if not no_D:
+            self.D = nn.Parameter(torch.empty(p, q, dtype=dtype).normal_(0.0, 1.0/n))
+        else:
+            # a buffer rather than a plain tensor, so it follows .to(device)
+            # and .to(dtype) with the rest of the module; forward skips the
+            # guaranteed-zero U @ D product entirely
+            self.register_buffer('D', torch.zeros(p, q, dtype=dtype))
+        # biases are separate vectors folded into the GEMM epilogues rather than
+        # extra weight columns acting on a padded ones column of U
+        self.B_bias = nn.Parameter(torch.empty(n, dtype=dtype).normal_(0.0, 1.0/n)) if bias else None
+        self.D_bias = nn.Parameter(torch.empty(q, dtype=dtype).normal_(0.0, 1.0/n)) if (bias and not no_D) else None
+
+        if use_fused_kernel:
+            # per-instance subclass, so the flag does not flip the shared class
+            f = type(f.__name__, (f,), {'use_fused_kernel': True})
         self.f = f
+        self.no_D = no_D
         self.bias = bias
+        self._X0_cache = {}
+        self._A_cached = None
+
+        if compile:
+            # fullgraph=False lets Dynamo graph-break at self.f.apply, so the
+            # data-dependent Picard loop is not traced into the graph
+            self.forward = torch.compile(self.forward, mode="reduce-overhead", fullgraph=False)
+
+    def train(self, mode: bool = True):
+        # the factors change between optimizer steps, so any cached projection is stale
+        self._A_cached = None
+        return super().train(mode)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        # loading new weights stales any cached projection, even in eval mode
+        # (e.g. a checkpoint-selection loop that never flips back to train)
+        self._A_cached = None
+        # checkpoints from before R was stored pre-transposed hold an (n, k) R;
+        # when n == k the layouts are indistinguishable and the key is left alone
+        key = prefix + 'R'
+        if (self.a_kind != 'dense' and key in state_dict and self.n != self.k
+                and state_dict[key].shape == (self.n, self.k)):
+            state_dict[key] = state_dict[key].t().contiguous()
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
+    def _apply(self, *args, **kwargs):
+        # .to()/.cuda()/.half() move the parameters but not a cached A built
+        # from their old device/dtype, so drop it alongside
+        self._A_cached = None
+        return super()._apply(*args, **kwargs)
 
     def project_onto_Linf_ball(self, A, v=0.97):
-        norm_inf_A = torch.linalg.matrix_norm(A, ord=float('inf')) 
-        if (norm_inf_A > v):
-            A = v*A/norm_inf_A
+        # A is stored right-acting, so the inf-norm of the operator it represents
+        # is the 1-norm (max column sum) of the stored matrix. The clamp makes the
+        # scale 1 inside the ball and v/norm outside it, with no host-side branch
+        # (a Python comparison on the norm would force a device-to-host sync).
+        # the reduction runs in fp32 so reduced-precision weights cannot
+        # overflow the column sums
+        norm_inf_A = torch.linalg.matrix_norm(A.float(), ord=1)
+        return A * (v / norm_inf_A.clamp(min=v)).to(A.dtype)
+
+    @staticmethod
+    def project_batch(mats, v=0.97):
+        """
+        Project a list of right-acting matrices onto the operator inf-norm ball
+        of radius v using one batched norm and one clamp, rather than a
+        reduction + scale launch per matrix. Useful when a container stacks
+        several LoRA blocks: all their factors can be projected together once
+        per step. Matrices of different shapes are zero-padded to a common size
+        for the reduction only (padding cannot raise a column sum); the
+        returned tensors keep their original shapes.
+        """
+        rows = max(m.shape[-2] for m in mats)
+        cols = max(m.shape[-1] for m in mats)
+        stack = torch.zeros(len(mats), rows, cols, dtype=torch.float32, device=mats[0].device)
+        for i, m in enumerate(mats):
+            stack[i, :m.shape[-2], :m.shape[-1]] = m
+        norms = torch.linalg.matrix_norm(stack, ord=1)
+        scales = v / norms.clamp(min=v)
+        return [m * scales[i].to(m.dtype) for i, m in enumerate(mats)]
+
+    def _lora_scales(self, v):
+        # Projection scales for both factors from a single clamp: both 1-norms
+        # are max column sums over the stored layouts, and stacking the two
+        # scalars keeps the clamp and divide to one launch instead of running
+        # the full projection (norm + scale kernel) twice.
+        norms = torch.stack([self.L.float().abs().sum(dim=0).amax(),
+                             self.R.float().abs().sum(dim=0).amax()])
+        return (v / norms.clamp(min=v)).to(self.L.dtype)
+
+    def _build_A(self):
+        """
+        Return the effective A matrix for the configured a_kind. The low-rank
+        variants are cached in eval mode, where the factors are frozen between
+        forwards and reprojecting/multiplying them every call is wasted work.
+        """
+        if self.a_kind == 'dense':
+            return self.A
+        # the cache holds a detached A, so only serve (or fill) it when no
+        # gradients are wanted; a grad-enabled eval forward (saliency,
+        # adversarial examples) always rebuilds A with its graph
+        use_cache = not self.training and not torch.is_grad_enabled()
+        if use_cache and self._A_cached is not None:
+            return self._A_cached
+        if self.a_kind == 'lora':
+            scales = self._lora_scales(0.97)
+            # the projections are plain scalar multiplies, so apply their
+            # product to the matmul output: one scale of the n*n result
+            # instead of writing back two scaled copies of the factors
+            A = (self.L @ self.R) * (scales[0] * scales[1])
         else:
-            pass
+            kappa = 0.95
+            kapp_diag = 0.45
+            scales = self._lora_scales(math.sqrt(kappa-kapp_diag))
+            A = (self.L @ self.R) * (scales[0] * scales[1])
+            # add the projected diagonal straight onto the matmul output instead of
+            # materializing a dense n*n diagonal (torch.diag / torch.eye, the latter
+            # on the default device) plus a third n*n tensor for the sum; the clamp
+            # is the same branchless projection as project_onto_Linf_ball
+            if self.diag:
+                diag_scale = kapp_diag / torch.abs(self.Diag).max().clamp(min=kapp_diag)
+                A.diagonal().add_(self.Diag * diag_scale)
+            else:
+                diag_scale = kappa / torch.abs(self.Diag).clamp(min=kappa)
+                A.diagonal().add_((self.Diag * diag_scale).squeeze())
+        if use_cache:
+            self._A_cached = A.detach()
         return A
 
-    def forward(self, U: torch.Tensor, X0: Optional[torch.Tensor] = None):
+    @_dynamo_disable
+    def _prepare_input(self, U: torch.Tensor):
+        # shape normalization and validation live outside the compiled graph,
+        # so _core_forward traces as a single static path
         if (len(U.size()) == 3):
             U = U.flatten(1, -1)
-        U = transpose(U)
-        if self.bias:
-            U = F.pad(U, (0, 0, 0, 1), value=1)
-        assert U.shape[0] == self.p, f'Given input size {U.shape[0]} does not match expected input size {self.p}.'
+        assert U.shape[-1] == self.p, f'Given input size {U.shape[-1]} does not match expected input size {self.p}.'
+        return U
 
-        m = U.shape[1]
-        X_shape = torch.Size([self.n, m])
+    def forward(self, U: torch.Tensor, X0: Optional[torch.Tensor] = None):
+        return self._core_forward(self._prepare_input(U), X0)
+
+    def _core_forward(self, U: torch.Tensor, X0: Optional[torch.Tensor]):
+        m = U.shape[0]
+        X_shape = torch.Size([m, self.n])
 
         if X0 is not None:
-            X0 = transpose(X0)
             assert X0.shape == X_shape
         else:
-            X0 = torch.zeros(X_shape, dtype=U.dtype, device=U.device)
-
-        L_projected = self.project_onto_Linf_ball(self.L, 0.97)
-        RT_projected = self.project_onto_Linf_ball(self.R.transpose(-1,-2), 0.97)
-
-        X = self.f.apply(L_projected @ RT_projected, self.B, X0, U)
-        return transpose(self.C @ X + self.D @ U)
-
-class ImplicitModelLoRA2(nn.Module):
+            # the solver never writes into X0, so a zero buffer can be reused
+            # across forwards instead of allocating and memsetting a fresh one
+            key = (m, U.dtype, U.device)
+            X0 = self._X0_cache.get(key)
+            if X0 is None:
+                X0 = torch.zeros(X_shape, dtype=U.dtype, device=U.device)
+                self._X0_cache[key] = X0
+
+        X = self.f.apply(self._build_A(), self.B, X0, U, self.B_bias)
+        if self.no_D:
+            return X @ self.C
+        # Fuse the two output GEMMs into one: [X | U] @ [C; D] saves a kernel
+        # launch and never materializes the intermediate X @ C.
+        Z = torch.cat([X, U], dim=1)
+        W = torch.cat([self.C, self.D], dim=0)
+        return torch.addmm(self.D_bias, Z, W) if self.bias else Z @ W
+
+class ImplicitModelLoRA(ImplicitModel):
+    """
+    Implicit model with A = L R; a thin alias for ImplicitModel(a_kind='lora')
+    kept for backwards compatibility with the original class-per-variant API.
+    """
     def __init__(self, k: int, n: int, p: int, q: int,
                  f: Optional[ImplicitFunction] = ImplicitFunctionInf,
                  no_D: Optional[bool] = False,
                  bias: Optional[bool] = False,
-                 diag: Optional[bool] = False):
+                 dtype: torch.dtype = torch.float32,
+                 compile: Optional[bool] = False):
+        super(ImplicitModelLoRA, self).__init__(n, p, q, f=f, no_D=no_D, bias=bias,
+                                                dtype=dtype, compile=compile,
+                                                a_kind='lora', k=k)
+
+class ImplicitModelLoRA2(ImplicitModel):
+    """
+    Implicit model with A = Diag + L R; a thin alias for
+    ImplicitModel(a_kind='lora_diag') kept for backwards compatibility with the
+    original class-per-variant API.
+    """
+    def __init__(self, k: int, n: int, p: int, q: int,
+                 f: Optional[ImplicitFunction] = ImplicitFunctionInf,
+                 no_D: Optional[bool] = False,
+                 bias: Optional[bool] = False,
+                 diag: Optional[bool] = False,
+                 dtype: torch.dtype = torch.float32,
+                 compile: Optional[bool] = False):
+        super(ImplicitModelLoRA2, self).__init__(n, p, q, f=f, no_D=no_D, bias=bias,
+                                                 dtype=dtype, compile=compile,
+                                                 a_kind='lora_diag', k=k, diag=diag)
+
+class ImplicitModelEnsemble(nn.Module):
+    def __init__(self, K: int, n: int, p: int, q: int,
+                 f: Optional[ImplicitFunction] = ImplicitFunctionInf,
+                 no_D: Optional[bool] = False,
+                 bias: Optional[bool] = False,
+                 dtype: torch.dtype = torch.float32):
         """
-        Create a new Implicit Model:
-            A1: n*r  A2: r*n  B: n*p  C: q*n  D: q*p
-            X: n*m  U: p*m, m = batch size
-            Note that for X and U, the batch size comes first when inputting into the model.
-            These sizes reflect that the model internally transposes them so that their sizes line up with ABCD.
-        
+        Create an ensemble of K independent Implicit Models that advance in lockstep:
+            A: K*n*n  B: K*p*n  C: K*n*q  D: K*p*q
+            X: K*m*n  U: K*m*p, m = batch size
+            All weights act on the right, exactly as in ImplicitModel, but every stage
+            is a single batched matmul, so the whole ensemble costs one kernel launch
+            per GEMM instead of K tiny launches.
+
         Args:
-            r: the LoRA dimension of A
+            K: the number of ensemble members.
             n: the number of hidden features.
             p: the number of input features.
             q: the number of output classes.
             f: the implicit function to use.
             no_D: whether or not to use the D matrix (i. e. whether the prediction equation should explicitly depend on the input U).
             bias: whether or not to use a bias.
+            dtype: dtype of the weights; fp16/bf16 hit the Tensor Core GEMM paths
+                (run under torch.autocast so the activations follow).
         """
-        super(ImplicitModelLoRA2, self).__init__()
-
-        if bias:
-            p += 1
+        super(ImplicitModelEnsemble, self).__init__()
 
-        self.k = k
+        self.K = K
         self.n = n
         self.p = p
         self.q = q
 
-        self.L = nn.Parameter(torch.randn(n, k)/n)
-        self.R = nn.Parameter(torch.randn(n, k)/n)
-
-        self.diag = diag
-        if self.diag:            
-            self.Diag = nn.Parameter(torch.randn(n)/n)
+        self.A = nn.Parameter(torch.empty(K, n, n, dtype=dtype).normal_(0.0, 1.0/n))
+        self.B = nn.Parameter(torch.empty(K, p, n, dtype=dtype).normal_(0.0, 1.0/n))
+        self.C = nn.Parameter(torch.empty(K, n, q, dtype=dtype).normal_(0.0, 1.0/n))
+        if not no_D:
+            self.D = nn.Parameter(torch.empty(K, p, q, dtype=dtype).normal_(0.0, 1.0/n))
         else:
-            self.Diag = nn.Parameter(torch.randn(1, 1)/n)
-
-        self.B = nn.Parameter(torch.randn(n, p)/n)
-        self.C = nn.Parameter(torch.randn(q, n)/n)
-        self.D = nn.Parameter(torch.randn(q, p)/n) if not no_D else torch.zeros((q, p), requires_grad=False)
+            # a buffer rather than a plain tensor, so it follows .to(device)
+            # and .to(dtype) with the rest of the module; forward skips the
+            # guaranteed-zero U @ D product entirely
+            self.register_buffer('D', torch.zeros(K, p, q, dtype=dtype))
+        # biases are separate vectors folded into the GEMM epilogues rather than
+        # extra weight columns acting on a padded ones column of U
+        self.B_bias = nn.Parameter(torch.empty(K, 1, n, dtype=dtype).normal_(0.0, 1.0/n)) if bias else None
+        self.D_bias = nn.Parameter(torch.empty(K, 1, q, dtype=dtype).normal_(0.0, 1.0/n)) if (bias and not no_D) else None
 
         self.f = f
+        self.no_D = no_D
         self.bias = bias
-
-    def project_onto_Linf_ball(self, A, v=0.97):
-        norm_inf_A = torch.linalg.matrix_norm(A, ord=float('inf')) 
-        if (norm_inf_A > v):
-            A = v*A/norm_inf_A
-        else:
-            pass
-        return A
+        self._X0_cache = {}
+
+    @_dynamo_disable
+    def _prepare_input(self, U: torch.Tensor):
+        # U is (K, m, p) with one batch per member, or (m, p) to feed the same
+        # batch to every member.
+        if (len(U.size()) == 2):
+            U = U.unsqueeze(0).expand(self.K, -1, -1)
+        assert U.shape[0] == self.K, f'Given ensemble size {U.shape[0]} does not match expected ensemble size {self.K}.'
+        assert U.shape[-1] == self.p, f'Given input size {U.shape[-1]} does not match expected input size {self.p}.'
+        return U
 
     def forward(self, U: torch.Tensor, X0: Optional[torch.Tensor] = None):
-        if (len(U.size()) == 3):
-            U = U.flatten(1, -1)
-        U = transpose(U)
-        if self.bias:
-            U = F.pad(U, (0, 0, 0, 1), value=1)
-        assert U.shape[0] == self.p, f'Given input size {U.shape[0]} does not match expected input size {self.p}.'
+        return self._core_forward(self._prepare_input(U), X0)
 
+    def _core_forward(self, U: torch.Tensor, X0: Optional[torch.Tensor]):
         m = U.shape[1]
-        X_shape = torch.Size([self.n, m])
+        X_shape = torch.Size([self.K, m, self.n])
 
         if X0 is not None:
-            X0 = transpose(X0)
             assert X0.shape == X_shape
         else:
-            X0 = torch.zeros(X_shape, dtype=U.dtype, device=U.device)
-
-        kappa = 0.95
-        kapp_diag = 0.45
-        if self.diag:       
-            Diag_projected = self.project_onto_Linf_ball(torch.diag(self.Diag), kapp_diag)
-        else:
-            if torch.abs(self.Diag) > kappa:
-                self.Diag = kappa * self.Diag/(self.Diag + 1e-10)
-            Diag_projected = self.Diag * torch.eye(self.n, self.n)
-        L_projected = self.project_onto_Linf_ball(self.L, math.sqrt(kappa-kapp_diag))
-        RT_projected = self.project_onto_Linf_ball(self.R.transpose(-1,-2), math.sqrt(kappa-kapp_diag))
-
-        X = self.f.apply(Diag_projected + L_projected @ RT_projected, self.B, X0, U)
-        return transpose(self.C @ X + self.D @ U)
+            # the solver never writes into X0, so a zero buffer can be reused
+            # across forwards instead of allocating and memsetting a fresh one
+            key = (m, U.dtype, U.device)
+            X0 = self._X0_cache.get(key)
+            if X0 is None:
+                X0 = torch.zeros(X_shape, dtype=U.dtype, device=U.device)
+                self._X0_cache[key] = X0
+
+        X = self.f.apply(self.A, self.B, X0, U, self.B_bias)
+        if self.no_D:
+            return X @ self.C
+        Y = torch.cat([X, U], dim=-1) @ torch.cat([self.C, self.D], dim=-2)
+        return Y + self.D_bias if self.bias else Y
@@ -26,9 +26,9 @@ class ImplicitRNNCell(nn.Module):
         self.layer = ImplicitModel(n, input_size+hidden_size, hidden_size, **kwargs)
 
     def forward(self, x):
-        outputs = torch.empty(*x.shape[:-1], self.hidden_size, device=x.device)
-        
-        h = torch.zeros(x.shape[0], self.hidden_size, device=x.device)
+        outputs = torch.empty(*x.shape[:-1], self.hidden_size, dtype=x.dtype, device=x.device)
+
+        h = torch.zeros(x.shape[0], self.hidden_size, dtype=x.dtype, device=x.device)
         for t in range(x.shape[1]):
             h = self.layer(torch.cat((x[:, t, :], h), dim=-1))
             outputs[:, t, :] = h
@@ -61,9 +61,9 @@ class MyRNNCell(nn.Module):
             )
 
     def forward(self, x):
-        outputs = torch.empty(*x.shape[:-1], self.hidden_size, device=x.device)
-        
-        h = torch.zeros(x.shape[0], self.hidden_size, device=x.device)
+        outputs = torch.empty(*x.shape[:-1], self.hidden_size, dtype=x.dtype, device=x.device)
+
+        h = torch.zeros(x.shape[0], self.hidden_size, dtype=x.dtype, device=x.device)
         for t in range(x.shape[1]):
             h = self.layer(torch.cat((x[:, t, :], h), dim=-1))
             outputs[:, t, :] = h
@@ -92,9 +92,9 @@ class ImplicitRNNCellLoRA(nn.Module):
         self.layer = ImplicitModelLoRA(k, n, input_size+hidden_size, hidden_size, **kwargs)
 
     def forward(self, x):
-        outputs = torch.empty(*x.shape[:-1], self.hidden_size, device=x.device)
-        
-        h = torch.zeros(x.shape[0], self.hidden_size, device=x.device)
+        outputs = torch.empty(*x.shape[:-1], self.hidden_size, dtype=x.dtype, device=x.device)
+
+        h = torch.zeros(x.shape[0], self.hidden_size, dtype=x.dtype, device=x.device)
         for t in range(x.shape[1]):
             h = self.layer(torch.cat((x[:, t, :], h), dim=-1))
             outputs[:, t, :] = h
@@ -0,0 +1,70 @@
+"""
+Optional Triton kernel for the Picard iteration of ImplicitFunction.
+
+Each solver step computes phi(X @ A + Z) — a GEMM followed by an elementwise
+ReLU, which eager PyTorch launches as two kernels with a full (m, n) round-trip
+through global memory in between. The kernel below fuses the add and the ReLU
+into the matmul epilogue so the intermediate never leaves registers. Triton is
+an optional dependency: when it is not installed, fused_step is None and the
+solver keeps its eager path.
+"""
+import torch
+
+try:
+    import triton
+    import triton.language as tl
+except ImportError:
+    triton = None
+
+
+if triton is not None:
+    @triton.jit
+    def _fused_step_kernel(x_ptr, a_ptr, z_ptr, out_ptr,
+                           M, N, K,
+                           stride_xm, stride_xk,
+                           stride_ak, stride_an,
+                           stride_zm, stride_zn,
+                           stride_om, stride_on,
+                           BLOCK_M: tl.constexpr, BLOCK_N: tl.constexpr, BLOCK_K: tl.constexpr):
+        pid_m = tl.program_id(0)
+        pid_n = tl.program_id(1)
+        rm = pid_m * BLOCK_M + tl.arange(0, BLOCK_M)
+        rn = pid_n * BLOCK_N + tl.arange(0, BLOCK_N)
+        rk = tl.arange(0, BLOCK_K)
+
+        x_ptrs = x_ptr + rm[:, None] * stride_xm + rk[None, :] * stride_xk
+        a_ptrs = a_ptr + rk[:, None] * stride_ak + rn[None, :] * stride_an
+        acc = tl.zeros((BLOCK_M, BLOCK_N), dtype=tl.float32)
+        for k in range(0, K, BLOCK_K):
+            x = tl.load(x_ptrs, mask=(rm[:, None] < M) & ((rk[None, :] + k) < K), other=0.0)
+            a = tl.load(a_ptrs, mask=((rk[:, None] + k) < K) & (rn[None, :] < N), other=0.0)
+            acc += tl.dot(x, a)
+            x_ptrs += BLOCK_K * stride_xk
+            a_ptrs += BLOCK_K * stride_ak
+
+        mask = (rm[:, None] < M) & (rn[None, :] < N)
+        z = tl.load(z_ptr + rm[:, None] * stride_zm + rn[None, :] * stride_zn, mask=mask, other=0.0)
+        # the add and the ReLU ride the matmul epilogue instead of a second kernel
+        acc = tl.maximum(acc + z, 0.0)
+        tl.store(out_ptr + rm[:, None] * stride_om + rn[None, :] * stride_on,
+                 acc.to(out_ptr.dtype.element_ty), mask=mask)
+
+    def fused_step(X, A, Z):
+        """
+        One fused Picard step: relu(X @ A + Z) in a single kernel launch.
+        X: (m, n)  A: (n, n)  Z: (m, n), all on the same CUDA device.
+        """
+        M, K = X.shape
+        N = A.shape[-1]
+        out = torch.empty((M, N), dtype=X.dtype, device=X.device)
+        grid = (triton.cdiv(M, 32), triton.cdiv(N, 32))
+        _fused_step_kernel[grid](X, A, Z, out,
+                                 M, N, K,
+                                 X.stride(0), X.stride(1),
+                                 A.stride(0), A.stride(1),
+                                 Z.stride(0), Z.stride(1),
+                                 out.stride(0), out.stride(1),
+                                 BLOCK_M=32, BLOCK_N=32, BLOCK_K=32)
+        return out
+else:
+    fused_step = None